@@ -0,0 +1,112 @@
+"""
+Compares memory and speed of raw Cosmos DB dictionaries with the compact typed records.
+The typed path includes parsing the records on arrival, which the trigger always does.
+
+Run from the repository root:
+    python -m benchmarks.records_benchmark
+"""
+import timeit
+import tracemalloc
+import uuid
+
+from utils.data_processing import assemble_data_for_stroke_prediction
+from utils.helpers import STROKE_REQUIRED_RECORD_TYPES, calculate_age, calculate_bmi, check_required_records_for_stroke
+from utils.records import parse_medical_records
+
+PATIENTS_COUNT = 10000
+
+PATIENT = {
+    "date_of_birth": "1982-10-27T18:24:15.425024+00:00",
+    "sex": "Male",
+    "ever_married": True
+}
+
+def create_medical_records(patient_id):
+    """
+    Creates raw medical records resembling Cosmos DB documents, including system fields.
+    """
+    system_fields = lambda: {
+        "id": str(uuid.uuid4()),
+        "patient_id": patient_id,
+        "note": "notes",
+        "created_date_utc": "2024-10-27T18:24:15.425024+00:00",
+        "created_by_id": str(uuid.uuid4()),
+        "_rid": "Zm9vYmFyAAAAAAAAAA==",
+        "_self": "dbs/Zm9vYg==/colls/Zm9vYmFy/docs/Zm9vYmFyAAAAAAAAAA==/",
+        "_etag": "\"00000000-0000-0000-0000-000000000000\"",
+        "_attachments": "attachments/",
+        "_ts": 1730053455
+    }
+    return [
+        {"type": "BloodPressure", "systolic_pressure": 150, "diastolic_pressure": 95, **system_fields()},
+        {"type": "BloodWork", "glucose_level": 4.2, **system_fields()},
+        {"type": "DiseaseHistory", "disease_type": "HeartDisease", **system_fields()},
+        {"type": "PhysicalExam", "work_type": "Private", "residency_type": "Urban", "smoking_status": "never smoked", "height": 175, "weight": 70, **system_fields()}
+    ]
+
+def measure_memory(build):
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+def check_required_records_from_dicts(records):
+    # Reference dict implementation the typed records replaced
+    found_types = {record.get("type") for record in records if record.get("type")}
+    return not STROKE_REQUIRED_RECORD_TYPES - found_types
+
+def assemble_data_from_dicts(patient, medical_records):
+    # Reference dict implementation the typed records replaced
+    medical_data = {record['type']: record for record in medical_records}
+    bp_record = medical_data.get("BloodPressure", {})
+    systolic = bp_record.get("systolic_pressure")
+    diastolic = bp_record.get("diastolic_pressure")
+    physical_exam = medical_data.get("PhysicalExam", {})
+    return {
+        "gender": patient.get("sex"),
+        "age": calculate_age(patient.get("date_of_birth")),
+        "ever_married": 'Yes' if patient.get("ever_married") else 'No',
+        "hypertension": (1 if (systolic >= 140 or diastolic >= 90) else 0) if systolic and diastolic else None,
+        "heart_disease": 1 if medical_data.get("DiseaseHistory", {}).get("disease_type") == "HeartDisease" else 0,
+        "work_type": physical_exam.get("work_type"),
+        "Residence_type": physical_exam.get("residency_type"),
+        "avg_glucose_level": medical_data.get("BloodWork", {}).get("glucose_level"),
+        "bmi": calculate_bmi(physical_exam.get("weight"), physical_exam.get("height")),
+        "smoking_status": physical_exam.get("smoking_status")
+    }
+
+def process(patients_records, predictors_count, check_required_records, assemble_data):
+    # Every predictor checks the required records and assembles its features
+    for records in patients_records.values():
+        for _ in range(predictors_count):
+            if check_required_records(records):
+                assemble_data(PATIENT, records)
+
+def parse(raw_records):
+    return {patient_id: parse_medical_records(records) for patient_id, records in raw_records.items()}
+
+def measure_time(run, number=5):
+    return timeit.timeit(run, number=number) / number
+
+def main():
+    raw_records = {str(index): create_medical_records(str(index)) for index in range(PATIENTS_COUNT)}
+
+    _, dict_memory = measure_memory(lambda: {patient_id: create_medical_records(patient_id) for patient_id in raw_records})
+    _, typed_memory = measure_memory(lambda: parse(raw_records))
+
+    print(f"Patients: {PATIENTS_COUNT}")
+    print(f"Memory per patient, dict records:  {dict_memory / PATIENTS_COUNT:.0f} bytes")
+    print(f"Memory per patient, typed records: {typed_memory / PATIENTS_COUNT:.0f} bytes")
+
+    parse_time = measure_time(lambda: parse(raw_records))
+    print(f"Parsing on arrival: {parse_time * 1000:.1f} ms")
+
+    for predictors_count in (1, 3):
+        dict_time = measure_time(lambda: process(raw_records, predictors_count, check_required_records_from_dicts, assemble_data_from_dicts))
+        typed_time = measure_time(lambda: process(parse(raw_records), predictors_count, check_required_records_for_stroke, assemble_data_for_stroke_prediction))
+        print(f"{predictors_count} predictor(s), dict records:                {dict_time * 1000:.1f} ms")
+        print(f"{predictors_count} predictor(s), typed records incl. parsing: {typed_time * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
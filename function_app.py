@@ -1,12 +1,13 @@
 import logging
 import azure.functions as func
 import joblib
-import pandas as pd
 from utils.blockchain import is_blockchain_valid
-from utils.cosmos_db import get_patient_data, get_medical_records_by_patient_id
+from utils.cosmos_db import get_patients_data
 from utils.data_processing import assemble_data_for_stroke_prediction
-from utils.helpers import check_required_records_for_stroke
+from utils.disease_predictors import predict_diseases, register_disease_predictor
+from utils.helpers import STROKE_REQUIRED_RECORD_TYPES, get_unique_patient_ids
 from utils.notifications import notify_patient_and_doctor
+from utils.records import parse_medical_records
 
 # Initialize Function App
 app = func.FunctionApp()
@@ -14,6 +15,14 @@ app = func.FunctionApp()
 stroke_model = joblib.load("random_forest_model.joblib")
 preprocessor = joblib.load("preprocessor.joblib")
 
+register_disease_predictor(
+    disease="Stroke",
+    required_record_types=STROKE_REQUIRED_RECORD_TYPES,
+    assemble_data=assemble_data_for_stroke_prediction,
+    model=stroke_model,
+    preprocessor=preprocessor
+)
+
 @app.cosmos_db_trigger(
     arg_name="azcosmosdb",
     container_name="medical_records",
@@ -26,40 +35,28 @@ preprocessor = joblib.load("preprocessor.joblib")
 def new_medical_record_trigger(azcosmosdb: func.DocumentList):
     logging.info('Python Cosmos DB trigger processed a batch of documents.')
     
-    for doc in azcosmosdb:
-        patient_id = doc.get("patient_id")
-        logging.info(f"Processing document for patient_id: {patient_id}")
-        
-        if not patient_id:
-            return
-        
-        patient = get_patient_data(patient_id)
-        medical_records = get_medical_records_by_patient_id(patient_id)
-        
-        if not check_required_records_for_stroke(medical_records):
-            logging.warning(f"One or more required records for stroke prediction are missing for patient_id: {patient_id}")
-            return
-        
-        logging.info(f"All required records for stroke prediction are present for patient_id: {patient_id}")
+    # Several documents in a batch may belong to the same patient
+    patient_ids = get_unique_patient_ids(azcosmosdb)
+    if not patient_ids:
+        return
 
-        medical_data = assemble_data_for_stroke_prediction(patient, medical_records)
-        if not is_blockchain_valid():
-            logging.warning("Blockchain is invalid. Prediction will not be made.")
-            return
+    logging.info(f"Processing documents for patient_ids: {patient_ids}")
 
-        logging.info(f"Assembled data for stroke prediction")
+    if not is_blockchain_valid():
+        logging.warning("Blockchain is invalid. Prediction will not be made.")
+        return
 
-        data_df = pd.DataFrame([medical_data])
-        preprocessed_data = preprocessor.transform(data_df)
+    # Parse records once on arrival, dropping system fields
+    patients_data = {
+        patient_id: (patient, parse_medical_records(medical_records))
+        for patient_id, (patient, medical_records) in get_patients_data(patient_ids).items()
+    }
 
-        logging.info(f"Preprocessed data for stroke prediction")
-        
-        result = stroke_model.predict(preprocessed_data)
-        logging.info(f"Stroke prediction for patient_id {patient_id}: {result[0]}")
+    at_risk = predict_diseases(patients_data)
 
-        if result[0]:
-            logging.info("Patient is in the risk of stroke")
-            notify_patient_and_doctor(patient, "Stroke")
+    for patient_id, diseases in at_risk.items():
+        if diseases:
+            logging.info(f"Patient {patient_id} is in the risk of: {', '.join(diseases)}")
+            notify_patient_and_doctor(patients_data[patient_id][0], diseases)
         else:
-            logging.info("Patient doesn't have the risk of stroke")
-            
+            logging.info(f"Patient {patient_id} doesn't have any predicted risks")
@@ -0,0 +1,40 @@
+import sys
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+# Avoid connecting to Cosmos DB when importing the module
+with patch.dict(sys.modules, {"azure": MagicMock(), "azure.cosmos": MagicMock()}):
+    from utils import cosmos_db
+
+class TestGetPatientsData(unittest.TestCase):
+
+    def setUp(self):
+        self.patients = {
+            "1": {"id": "1"},
+            "2": {"id": "2"}
+        }
+
+        get_patient_patcher = patch.object(cosmos_db, "get_patient_data", side_effect=self.patients.get)
+        get_records_patcher = patch.object(cosmos_db, "get_medical_records_by_patient_id", side_effect=lambda patient_id: [{"type": "BloodWork", "patient_id": patient_id}])
+
+        self.get_patient_data = get_patient_patcher.start()
+        self.get_medical_records = get_records_patcher.start()
+        self.addCleanup(patch.stopall)
+
+    def test_each_patient_fetched_once(self):
+        # Test that every patient and their records are fetched exactly once
+        result = cosmos_db.get_patients_data(["1", "2"])
+
+        self.assertEqual(self.get_patient_data.call_args_list, [call("1"), call("2")])
+        self.assertEqual(self.get_medical_records.call_args_list, [call("1"), call("2")])
+        self.assertEqual(result["1"], ({"id": "1"}, [{"type": "BloodWork", "patient_id": "1"}]))
+
+    def test_missing_patient_skipped(self):
+        # Test that records are not fetched for a patient that is not found
+        result = cosmos_db.get_patients_data(["1", "3"])
+
+        self.assertEqual(list(result), ["1"])
+        self.get_medical_records.assert_called_once_with("1")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import unittest
+from utils.disease_predictors import predict_diseases, register_disease_predictor, DISEASE_PREDICTORS
+from utils.records import parse_medical_records
+
+class FakePreprocessor:
+    def __init__(self):
+        self.calls = 0
+
+    def transform(self, data_df):
+        self.calls += 1
+        return data_df
+
+class FakeModel:
+    def __init__(self):
+        self.calls = 0
+
+    def predict(self, data_df):
+        self.calls += 1
+        return [1 if value > 100 else 0 for value in data_df["value"]]
+
+def assemble_data(patient, medical_records):
+    return {"value": patient["value"]}
+
+class TestPredictDiseases(unittest.TestCase):
+
+    def setUp(self):
+        self.preprocessor = FakePreprocessor()
+        self.model = FakeModel()
+        self.predictors = {
+            "Stroke": {
+                "required_record_types": frozenset({"BloodWork"}),
+                "assemble_data": assemble_data,
+                "model": self.model,
+                "preprocessor": self.preprocessor
+            }
+        }
+        self.patients_data = {
+            "1": ({"value": 150}, [{"type": "BloodWork"}]),
+            "2": ({"value": 50}, [{"type": "BloodWork"}]),
+            "3": ({"value": 200}, [{"type": "PhysicalExam"}])
+        }
+
+    def test_predictions_are_batched_per_model(self):
+        """
+        Test that all applicable patients are scored with a single model call.
+        """
+        predict_diseases(self.patients_data, self.predictors)
+
+        self.assertEqual(self.preprocessor.calls, 1)
+        self.assertEqual(self.model.calls, 1)
+
+    def test_patients_missing_records_are_skipped(self):
+        """
+        Test that only patients with the required records are flagged.
+        """
+        result = predict_diseases(self.patients_data, self.predictors)
+
+        self.assertEqual(result, {"1": ["Stroke"], "2": [], "3": []})
+
+    def test_multiple_diseases_are_combined_per_patient(self):
+        """
+        Test that risks from several predictors are collected for the same patient.
+        """
+        self.predictors["Diabetes"] = dict(self.predictors["Stroke"], required_record_types=frozenset({"PhysicalExam"}))
+
+        result = predict_diseases(self.patients_data, self.predictors)
+
+        self.assertEqual(result["1"], ["Stroke"])
+        self.assertEqual(result["3"], ["Diabetes"])
+
+    def test_predictor_with_other_record_type_on_parsed_records(self):
+        """
+        Test that a predictor needing a record type and fields outside the stroke model runs on parsed records.
+        """
+        self.predictors["HighCholesterol"] = {
+            "required_record_types": frozenset({"Cholesterol", "BloodWork"}),
+            "assemble_data": lambda patient, medical_records: {"value": medical_records.get("Cholesterol").ldl * 40 + medical_records.blood_work.hba1c},
+            "model": FakeModel(),
+            "preprocessor": FakePreprocessor()
+        }
+        patients_data = {
+            "1": ({"value": 150}, parse_medical_records([
+                {"type": "BloodWork", "glucose_level": 4.2, "hba1c": 7.1, "_ts": 1},
+                {"type": "Cholesterol", "ldl": 3.1, "_ts": 2}
+            ])),
+            "2": ({"value": 50}, parse_medical_records([{"type": "BloodWork", "glucose_level": 4.2}]))
+        }
+
+        result = predict_diseases(patients_data, self.predictors)
+
+        self.assertEqual(result, {"1": ["Stroke", "HighCholesterol"], "2": []})
+
+    def test_failing_predictor_does_not_stop_others(self):
+        """
+        Test that an error in one model is logged and the other diseases are still scored.
+        """
+        class FailingModel:
+            def predict(self, data_df):
+                raise ValueError("model failure")
+
+        self.predictors = {
+            "Diabetes": dict(self.predictors["Stroke"], model=FailingModel()),
+            "Stroke": self.predictors["Stroke"]
+        }
+
+        with self.assertLogs(level="ERROR") as logs:
+            result = predict_diseases(self.patients_data, self.predictors)
+
+        self.assertIn("Diabetes", logs.output[0])
+        self.assertEqual(result["1"], ["Stroke"])
+
+    def test_failing_assembly_skips_only_that_patient(self):
+        """
+        Test that an assembly error skips only the affected patient.
+        """
+        self.patients_data["2"] = ({}, [{"type": "BloodWork"}])
+
+        with self.assertLogs(level="ERROR") as logs:
+            result = predict_diseases(self.patients_data, self.predictors)
+
+        self.assertIn("patient_id 2", logs.output[0])
+        self.assertEqual(result, {"1": ["Stroke"], "2": [], "3": []})
+
+    def test_register_disease_predictor(self):
+        """
+        Test that registered predictors are stored in the registry.
+        """
+        predictor = register_disease_predictor("TestDisease", ["BloodWork"], assemble_data, self.model, self.preprocessor)
+        self.addCleanup(DISEASE_PREDICTORS.pop, "TestDisease")
+
+        self.assertIs(DISEASE_PREDICTORS["TestDisease"], predictor)
+        self.assertEqual(predictor["required_record_types"], frozenset({"BloodWork"}))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,6 @@
 import datetime
 import unittest
-from utils.helpers import calculate_age, calculate_bmi, check_required_records_for_stroke
+from utils.helpers import calculate_age, calculate_bmi, check_required_records, check_required_records_for_stroke, get_unique_patient_ids
 
 class TestCalculateAge(unittest.TestCase):
     def test_calculate_age_valid_date(self):
@@ -60,5 +60,26 @@ class TestCheckRequiredRecordsForStroke(unittest.TestCase):
         ]
         self.assertFalse(check_required_records_for_stroke(records))
 
+class TestCheckRequiredRecords(unittest.TestCase):
+    def test_check_required_records_custom_types(self):
+        # Test with a custom set of required types
+        records = [
+            {"type": "BloodWork"},
+            {"type": "PhysicalExam"}
+        ]
+        self.assertTrue(check_required_records(records, {"BloodWork"}))
+        self.assertFalse(check_required_records(records, {"BloodWork", "DiseaseHistory"}))
+
+class TestGetUniquePatientIds(unittest.TestCase):
+    def test_get_unique_patient_ids_removes_duplicates(self):
+        # Test that duplicate and missing patient IDs are dropped, keeping order
+        documents = [
+            {"patient_id": "2"},
+            {"patient_id": "1"},
+            {"patient_id": "2"},
+            {"id": "no-patient"}
+        ]
+        self.assertEqual(get_unique_patient_ids(documents), ["2", "1"])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,70 @@
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Avoid connecting to Cosmos DB when importing the notifications module
+with patch.dict(sys.modules, {"utils.cosmos_db": MagicMock()}):
+    from utils import notifications
+
+class TestNotifyPatientAndDoctor(unittest.TestCase):
+
+    def setUp(self):
+        self.patient = {
+            "user_id": "patient-user-id",
+            "doctor_id": "doctor-user-id"
+        }
+        self.users = {
+            "patient-user-id": {"name": "John", "email": "john@example.com"},
+            "doctor-user-id": {"name": "Dr. Smith", "email": "smith@example.com"}
+        }
+
+        get_user_patcher = patch.object(notifications, "get_user_by_user_id", side_effect=self.users.get)
+        send_email_patcher = patch.object(notifications, "send_email", return_value=True)
+        add_notification_patcher = patch.object(notifications, "add_health_notification", return_value={"id": "1"})
+
+        self.get_user = get_user_patcher.start()
+        self.send_email = send_email_patcher.start()
+        self.add_health_notification = add_notification_patcher.start()
+        self.addCleanup(patch.stopall)
+
+    def test_one_email_pair_for_several_diseases(self):
+        # Test that several diseases are combined into one email per recipient
+        result = notifications.notify_patient_and_doctor(self.patient, ["Stroke", "Diabetes"])
+
+        self.assertTrue(result)
+        self.assertEqual(self.send_email.call_count, 2)
+        recipients = [email_call.args[2] for email_call in self.send_email.call_args_list]
+        self.assertEqual(recipients, ["john@example.com", "smith@example.com"])
+        self.assertIn("Stroke, Diabetes", self.send_email.call_args_list[0].args[0])
+
+    def test_one_health_notification_per_disease(self):
+        # Test that a health notification is stored for every disease
+        notifications.notify_patient_and_doctor(self.patient, ["Stroke", "Diabetes"])
+
+        diseases = [notification_call.kwargs["disease"] for notification_call in self.add_health_notification.call_args_list]
+        self.assertEqual(diseases, ["Stroke", "Diabetes"])
+
+    def test_single_disease_string(self):
+        # Test that a single disease name is still accepted
+        result = notifications.notify_patient_and_doctor(self.patient, "Stroke")
+
+        self.assertTrue(result)
+        self.assertEqual(self.send_email.call_args_list[0].args[0], "Health Notification: Stroke Alert")
+        self.add_health_notification.assert_called_once()
+        self.assertEqual(self.add_health_notification.call_args.kwargs["disease"], "Stroke")
+
+    def test_failed_health_notification(self):
+        # Test that a failed notification write is reported
+        self.add_health_notification.side_effect = [{"id": "1"}, None]
+
+        self.assertFalse(notifications.notify_patient_and_doctor(self.patient, ["Stroke", "Diabetes"]))
+
+    def test_failed_email(self):
+        # Test that no health notification is stored when an email fails
+        self.send_email.return_value = False
+
+        self.assertFalse(notifications.notify_patient_and_doctor(self.patient, ["Stroke"]))
+        self.add_health_notification.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from utils.helpers import check_required_records, check_required_records_for_stroke
+from utils.records import BloodPressureRecord, PatientRecords, parse_medical_records
+
+class TestParseMedicalRecords(unittest.TestCase):
+
+    def setUp(self):
+        self.medical_records = [
+            {
+                "type": "BloodPressure",
+                "note": "notes",
+                "patient_id": "7b3e4fc8-74f6-4f08-914f-b151287cbc34",
+                "systolic_pressure": 150,
+                "diastolic_pressure": 95,
+                "id": "212ed41c-30c6-4ed1-800b-db13a34be49a",
+                "_rid": "rid",
+                "_etag": "etag",
+                "_ts": 1730053455
+            },
+            {"type": "BloodWork", "glucose_level": 4.2},
+            {"type": "DiseaseHistory", "disease_type": "HeartDisease"},
+            {"type": "PhysicalExam", "work_type": "Private", "residency_type": "Urban", "smoking_status": "never smoked", "height": 175, "weight": 70},
+            {"type": "UnrelatedRecord", "value": 1}
+        ]
+
+    def test_parse_drops_system_fields(self):
+        """
+        Test that system fields are dropped and declared fields are kept.
+        """
+        records = parse_medical_records(self.medical_records)
+
+        self.assertEqual(records.blood_pressure, BloodPressureRecord.from_dict({"systolic_pressure": 150, "diastolic_pressure": 95}))
+        self.assertIsNone(records.blood_pressure.extra)
+        self.assertFalse(hasattr(records.blood_pressure, "_rid"))
+        self.assertFalse(hasattr(records.blood_pressure, "__dict__"))
+        self.assertEqual(records.physical_exam.residency_type, "Urban")
+
+    def test_parse_keeps_other_types(self):
+        """
+        Test that record types without a dedicated class are kept without system fields.
+        """
+        records = parse_medical_records(self.medical_records + [{"type": "Cholesterol", "ldl": 3.1, "_ts": 1730053455}])
+
+        self.assertEqual(records.types, {"BloodPressure", "BloodWork", "DiseaseHistory", "PhysicalExam", "UnrelatedRecord", "Cholesterol"})
+        self.assertEqual(records.get("Cholesterol").ldl, 3.1)
+        self.assertEqual(records.get("Cholesterol").extra, {"ldl": 3.1})
+        self.assertTrue(check_required_records(records, {"Cholesterol"}))
+
+    def test_parse_keeps_extra_fields(self):
+        """
+        Test that fields not used by the stroke model are still available.
+        """
+        records = parse_medical_records([{"type": "BloodWork", "glucose_level": 4.2, "hba1c": 7.1}])
+
+        self.assertEqual(records.blood_work.hba1c, 7.1)
+        self.assertIsNone(parse_medical_records(self.medical_records).blood_pressure.extra)
+
+    def test_missing_field_raises(self):
+        """
+        Test that reading a field the record does not have fails instead of returning None.
+        """
+        records = parse_medical_records([{"type": "BloodWork", "glucose_level": 4.2}])
+
+        with self.assertRaises(AttributeError):
+            records.blood_work.hba1c
+
+    def test_parse_latest_record_wins(self):
+        """
+        Test that a later record of the same type replaces the earlier one.
+        """
+        records = parse_medical_records(self.medical_records + [{"type": "BloodWork", "glucose_level": 5.1}])
+
+        self.assertEqual(records.blood_work.glucose_level, 5.1)
+
+    def test_check_required_records_with_patient_records(self):
+        """
+        Test that required records are checked on parsed records.
+        """
+        self.assertTrue(check_required_records_for_stroke(parse_medical_records(self.medical_records)))
+        self.assertFalse(check_required_records_for_stroke(PatientRecords()))
+
+if __name__ == '__main__':
+    unittest.main()
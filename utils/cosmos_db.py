@@ -38,10 +38,10 @@ def get_medical_records_by_patient_id(patient_id):
     Queries Cosmos DB for all medical records with the given patient_id.
     
     :param patient_id: The ID of the patient to search for.
-    :return: A list of records for the specified patient_id.
+    :return: A list of records for the specified patient_id, oldest first.
     """
     try:
-        query = "SELECT * FROM c WHERE c.patient_id = @patient_id"
+        query = "SELECT * FROM c WHERE c.patient_id = @patient_id ORDER BY c._ts"
         parameters = [{"name": "@patient_id", "value": patient_id}]
         
         results = medical_records_container.query_items(
@@ -58,6 +58,22 @@ def get_medical_records_by_patient_id(patient_id):
         logging.error(f"Error querying Cosmos DB for patient_id {patient_id}: {e}")
         return []
 
+def get_patients_data(patient_ids):
+    """
+    Fetches each patient and their medical records once.
+
+    :param patient_ids: List of unique patient IDs.
+    :return: Dictionary mapping patient_id to a (patient, medical_records) tuple. Patients that are not found are skipped.
+    """
+    patients_data = {}
+    for patient_id in patient_ids:
+        patient = get_patient_data(patient_id)
+        if not patient:
+            continue
+
+        patients_data[patient_id] = (patient, get_medical_records_by_patient_id(patient_id))
+    return patients_data
+
 def get_user_by_user_id(user_id):
     """
     Fetches user data from the Cosmos DB users container.
@@ -1,15 +1,16 @@
 from utils.helpers import calculate_age, calculate_bmi
+from utils.records import as_patient_records
 
 def assemble_data_for_stroke_prediction(patient, medical_records):
     """
     Assembles the data required for stroke prediction based on patient and medical records.
 
     :param patient: Dictionary containing patient information.
-    :param medical_records: List of dictionaries containing patient's medical records.
+    :param medical_records: PatientRecords instance or list of dictionaries containing patient's medical records.
     :return: Dictionary with compiled data for prediction.
     """
-    # Organize records by type
-    medical_data = {record['type']: record for record in medical_records}
+    # Parse raw records unless they were already parsed on arrival
+    medical_data = as_patient_records(medical_records)
 
     # Assemble model data
     model_data = {
@@ -26,28 +27,27 @@ def assemble_data_for_stroke_prediction(patient, medical_records):
     }
 
     # Process Blood Pressure and Hypertension
-    bp_record = medical_data.get("BloodPressure", {})
-    systolic = bp_record.get("systolic_pressure")
-    diastolic = bp_record.get("diastolic_pressure")
-    if systolic and diastolic:
+    bp_record = medical_data.blood_pressure
+    if bp_record and bp_record.systolic_pressure and bp_record.diastolic_pressure:
+        systolic = bp_record.systolic_pressure
+        diastolic = bp_record.diastolic_pressure
         model_data["hypertension"] = 1 if (systolic >= 140 or diastolic >= 90) else 0
 
     # Process Disease History for Heart Disease
-    disease_history = medical_data.get("DiseaseHistory", {})
-    model_data["heart_disease"] = 1 if disease_history.get("disease_type") == "HeartDisease" else 0
+    disease_history = medical_data.disease_history
+    model_data["heart_disease"] = 1 if disease_history and disease_history.disease_type == "HeartDisease" else 0
 
     # Process Physical Exam data
-    physical_exam = medical_data.get("PhysicalExam", {})
-    model_data["work_type"] = physical_exam.get("work_type")
-    model_data["Residence_type"] = physical_exam.get("residency_type")
-    model_data["smoking_status"] = physical_exam.get("smoking_status")
-    
-    weight = physical_exam.get("weight")
-    height = physical_exam.get("height")
-    model_data["bmi"] = calculate_bmi(weight, height)
+    physical_exam = medical_data.physical_exam
+    if physical_exam:
+        model_data["work_type"] = physical_exam.work_type
+        model_data["Residence_type"] = physical_exam.residency_type
+        model_data["smoking_status"] = physical_exam.smoking_status
+        model_data["bmi"] = calculate_bmi(physical_exam.weight, physical_exam.height)
 
     # Process Blood Work
-    blood_work = medical_data.get("BloodWork", {})
-    model_data["avg_glucose_level"] = blood_work.get("glucose_level")
+    blood_work = medical_data.blood_work
+    if blood_work:
+        model_data["avg_glucose_level"] = blood_work.glucose_level
 
     return model_data
\ No newline at end of file
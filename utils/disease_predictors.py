@@ -0,0 +1,75 @@
+import logging
+import pandas as pd
+from utils.helpers import check_required_records
+
+# Registry of disease predictors keyed by disease name
+DISEASE_PREDICTORS = {}
+
+def register_disease_predictor(disease, required_record_types, assemble_data, model, preprocessor):
+    """
+    Registers a disease predictor so it is run for every patient in a trigger batch.
+
+    :param disease: Name of the disease, used in logs and notifications.
+    :param required_record_types: Iterable of medical record types the predictor needs.
+    :param assemble_data: Function taking (patient, medical_records) and returning a feature dictionary.
+    :param model: Fitted model exposing predict().
+    :param preprocessor: Fitted preprocessor exposing transform().
+    :return: Dictionary describing the registered predictor.
+    """
+    predictor = {
+        "required_record_types": frozenset(required_record_types),
+        "assemble_data": assemble_data,
+        "model": model,
+        "preprocessor": preprocessor
+    }
+    DISEASE_PREDICTORS[disease] = predictor
+    return predictor
+
+def predict_diseases(patients_data, predictors=None):
+    """
+    Runs every applicable predictor over the already fetched patient data.
+    Feature rows are assembled per predictor and scored in a single batch per model.
+    A failing predictor is logged and skipped so the other diseases are still scored.
+
+    :param patients_data: Dictionary mapping patient_id to a (patient, medical_records) tuple.
+    :param predictors: Optional dictionary of predictors, defaults to the registered ones.
+    :return: Dictionary mapping patient_id to the list of diseases the patient is at risk for.
+    """
+    if predictors is None:
+        predictors = DISEASE_PREDICTORS
+
+    at_risk = {patient_id: [] for patient_id in patients_data}
+
+    for disease, predictor in predictors.items():
+        patient_ids = []
+        rows = []
+        for patient_id, (patient, medical_records) in patients_data.items():
+            if not check_required_records(medical_records, predictor["required_record_types"]):
+                logging.warning(f"One or more required records for {disease} prediction are missing for patient_id: {patient_id}")
+                continue
+
+            try:
+                rows.append(predictor["assemble_data"](patient, medical_records))
+            except Exception as e:
+                logging.error(f"Failed to assemble data for {disease} prediction for patient_id {patient_id}: {e}")
+                continue
+            patient_ids.append(patient_id)
+
+        if not rows:
+            continue
+
+        try:
+            data_df = pd.DataFrame(rows)
+            preprocessed_data = predictor["preprocessor"].transform(data_df)
+            results = predictor["model"].predict(preprocessed_data)
+        except Exception as e:
+            logging.error(f"{disease} prediction failed: {e}")
+            continue
+        logging.info(f"{disease} prediction made for {len(rows)} patients")
+
+        for patient_id, result in zip(patient_ids, results):
+            logging.info(f"{disease} prediction for patient_id {patient_id}: {result}")
+            if result:
+                at_risk[patient_id].append(disease)
+
+    return at_risk
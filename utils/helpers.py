@@ -1,5 +1,8 @@
 import datetime
 import logging
+from utils.records import as_patient_records
+
+STROKE_REQUIRED_RECORD_TYPES = frozenset({"BloodPressure", "BloodWork", "DiseaseHistory", "PhysicalExam"})
 
 def calculate_age(dob):
     """
@@ -29,18 +32,36 @@ def calculate_bmi(weight, height):
     bmi = weight / (height_in_meters ** 2)
     return bmi
 
-def check_required_records_for_stroke(records):
+def check_required_records(records, required_types):
     """
-    Checks if all required medical record types are present for stroke prediction.
+    Checks if all required medical record types are present.
     
-    :param records: List of medical records for a patient.
+    :param records: PatientRecords instance or list of medical records for a patient.
+    :param required_types: Set of record types that must be present.
     :return: Boolean indicating if all required types are present.
     """
-    required_types = {"BloodPressure", "BloodWork", "DiseaseHistory", "PhysicalExam"}
-    found_types = {record.get("type") for record in records if record.get("type")}
+    found_types = as_patient_records(records).types
 
-    missing_types = required_types - found_types
+    missing_types = set(required_types) - found_types
     if missing_types:
         logging.info(f"Missing required records: {missing_types}")
         return False
     return True
+
+def check_required_records_for_stroke(records):
+    """
+    Checks if all required medical record types are present for stroke prediction.
+    
+    :param records: PatientRecords instance or list of medical records for a patient.
+    :return: Boolean indicating if all required types are present.
+    """
+    return check_required_records(records, STROKE_REQUIRED_RECORD_TYPES)
+
+def get_unique_patient_ids(documents):
+    """
+    Collects unique patient IDs from a batch of medical record documents, keeping their order.
+    
+    :param documents: Iterable of medical record documents.
+    :return: List of unique patient IDs.
+    """
+    return list(dict.fromkeys(doc.get("patient_id") for doc in documents if doc.get("patient_id")))
@@ -4,7 +4,11 @@ from utils.cosmos_db import add_health_notification, get_user_by_user_id
 from utils.email import send_email
 
 
-def notify_patient_and_doctor(patient, disease):
+def notify_patient_and_doctor(patient, diseases):
+    if isinstance(diseases, str):
+        diseases = [diseases]
+    disease = ", ".join(diseases)
+
     patient_id = patient.get("user_id")
     doctor_id = patient.get("doctor_id")
 
@@ -33,13 +37,16 @@ def notify_patient_and_doctor(patient, disease):
     doctor_email_sent = send_email(subject, f"Patient {patient_user.get('name')} may have {disease}. Please review their medical records.", doctor_email)
 
     if patient_email_sent and doctor_email_sent:
-        notification = add_health_notification(
-            title=f"{disease} Alert",
-            text=f"Notification for potential {disease} risk sent to patient and doctor.",
-            disease=disease,
-            patient_id=patient_id
-        )
-        if notification:
+        notifications = [
+            add_health_notification(
+                title=f"{risk} Alert",
+                text=f"Notification for potential {risk} risk sent to patient and doctor.",
+                disease=risk,
+                patient_id=patient_id
+            )
+            for risk in diseases
+        ]
+        if all(notifications):
             logging.info("Health notification created and emails sent successfully.")
             return True
         else:
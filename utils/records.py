@@ -0,0 +1,171 @@
+SYSTEM_FIELDS = frozenset({
+    "id", "type", "patient_id", "note", "created_date_utc", "created_by_id",
+    "_rid", "_self", "_etag", "_attachments", "_ts"
+})
+
+class MedicalRecord:
+    """
+    Base class for compact medical records.
+    Declared fields are stored in slots, any other non-system fields are kept in the extra dictionary.
+    System fields (_rid, _etag, _ts, note, ids) are dropped when parsing.
+    """
+    __slots__ = ("extra",)
+    fields = ()
+    record_type = None
+    _known_fields = SYSTEM_FIELDS
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._known_fields = SYSTEM_FIELDS | set(cls.fields)
+
+    @classmethod
+    def from_dict(cls, record):
+        """
+        Creates a typed record from a raw Cosmos DB document.
+
+        :param record: Dictionary containing the medical record.
+        :return: Instance of the record class.
+        """
+        instance = cls.__new__(cls)
+        for field in cls.fields:
+            setattr(instance, field, record.get(field))
+        extra_fields = record.keys() - cls._known_fields
+        instance.extra = {field: record[field] for field in extra_fields} if extra_fields else None
+        return instance
+
+    def __getattr__(self, field):
+        # Only called when the field is not a slot, so look it up in the extra fields
+        extra = object.__getattribute__(self, "extra") if field != "extra" else None
+        if extra and field in extra:
+            return extra[field]
+        raise AttributeError(f"{type(self).__name__} has no field '{field}'")
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in ("record_type", "extra") + self.fields)
+
+    def __repr__(self):
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.fields)
+        return f"{type(self).__name__}({fields}, extra={self.extra!r})"
+
+class BloodPressureRecord(MedicalRecord):
+    fields = ("systolic_pressure", "diastolic_pressure")
+    __slots__ = fields
+    record_type = "BloodPressure"
+
+class BloodWorkRecord(MedicalRecord):
+    fields = ("glucose_level",)
+    __slots__ = fields
+    record_type = "BloodWork"
+
+class DiseaseHistoryRecord(MedicalRecord):
+    fields = ("disease_type",)
+    __slots__ = fields
+    record_type = "DiseaseHistory"
+
+class PhysicalExamRecord(MedicalRecord):
+    fields = ("work_type", "residency_type", "smoking_status", "height", "weight")
+    __slots__ = fields
+    record_type = "PhysicalExam"
+
+class GenericRecord(MedicalRecord):
+    """
+    Record of a type without a dedicated class, all its non-system fields are kept in extra.
+    """
+    __slots__ = ("record_type",)
+
+    @classmethod
+    def from_dict(cls, record):
+        instance = super().from_dict(record)
+        instance.record_type = record.get("type")
+        return instance
+
+RECORD_CLASSES = {
+    record_class.record_type: record_class
+    for record_class in (BloodPressureRecord, BloodWorkRecord, DiseaseHistoryRecord, PhysicalExamRecord)
+}
+
+class PatientRecords:
+    """
+    Latest record of each type for a single patient.
+    Types with a dedicated class are stored in slots, other types in the others dictionary.
+    """
+    __slots__ = ("blood_pressure", "blood_work", "disease_history", "physical_exam", "others")
+
+    _attributes = {
+        "BloodPressure": "blood_pressure",
+        "BloodWork": "blood_work",
+        "DiseaseHistory": "disease_history",
+        "PhysicalExam": "physical_exam"
+    }
+
+    def __init__(self, blood_pressure=None, blood_work=None, disease_history=None, physical_exam=None, others=None):
+        self.blood_pressure = blood_pressure
+        self.blood_work = blood_work
+        self.disease_history = disease_history
+        self.physical_exam = physical_exam
+        self.others = others
+
+    def get(self, record_type):
+        """
+        Returns the record of the given type or None if it is missing.
+
+        :param record_type: Medical record type, e.g. "BloodPressure".
+        :return: Typed record or None.
+        """
+        attribute = self._attributes.get(record_type)
+        if attribute:
+            return getattr(self, attribute)
+        return self.others.get(record_type) if self.others else None
+
+    def set(self, record):
+        """
+        Stores the record, replacing a previous record of the same type.
+
+        :param record: Typed record.
+        """
+        attribute = self._attributes.get(record.record_type)
+        if attribute:
+            setattr(self, attribute, record)
+        else:
+            if self.others is None:
+                self.others = {}
+            self.others[record.record_type] = record
+
+    @property
+    def types(self):
+        """
+        Set of record types present for the patient.
+        """
+        types = {record_type for record_type, attribute in self._attributes.items() if getattr(self, attribute) is not None}
+        if self.others:
+            types.update(self.others)
+        return types
+
+def parse_medical_records(records):
+    """
+    Parses raw medical records into a compact PatientRecords instance.
+    Records are expected oldest first, so a later record of the same type replaces the earlier one.
+    Records without a type are ignored.
+
+    :param records: List of dictionaries containing patient's medical records.
+    :return: PatientRecords instance.
+    """
+    patient_records = PatientRecords()
+    for record in records:
+        record_type = record.get("type")
+        if record_type:
+            patient_records.set(RECORD_CLASSES.get(record_type, GenericRecord).from_dict(record))
+    return patient_records
+
+def as_patient_records(records):
+    """
+    Returns the records as PatientRecords, parsing them if a list of dictionaries is given.
+
+    :param records: PatientRecords instance or list of dictionaries.
+    :return: PatientRecords instance.
+    """
+    if isinstance(records, PatientRecords):
+        return records
+    return parse_medical_records(records)